@@ -11,14 +11,24 @@ v7.5.2 → v7.5.3 변경사항:
 import os
 import sys
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import feedparser
-from datetime import datetime
+from datetime import datetime, timedelta
 from pathlib import Path
 import json
+import orjson
 import time
+import random
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import urlparse, urljoin
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
+import lxml.html
+from lxml import etree
 import hashlib
+import mimetypes
+import shutil
 import re
 import html
 
@@ -33,9 +43,17 @@ PRONEWS_RSS            = "https://jp.pronews.com/feed"
 PRONEWS_ARCHIVE_BASE   = "https://jp.pronews.com/news/page"
 PRONEWS_BASE_URL       = "https://jp.pronews.com"
 POSTED_ARTICLES_FILE   = "posted_articles.json"
+RSS_CACHE_FILE         = "rss_cache.json"   # RSS 조건부 요청용 ETag/Last-Modified + 항목
 FORCE_UPDATE           = os.environ.get("FORCE_UPDATE", "false").lower() == "true"
 DAILY_LIMIT            = 10
 ARCHIVE_MAX_PAGES      = 20
+ARCHIVE_FETCH_WORKERS  = 3      # 아카이브 페이지 동시 요청 수
+MIN_TITLE_LENGTH       = 10
+GEMINI_BODY_LIMIT      = 15000  # 프롬프트에 넣는 본문 최대 글자수
+PREFETCH_AHEAD         = 2      # 처리 중인 기사 외에 미리 받아둘 기사 페이지 수
+WP_INDEX_DAYS          = 30     # 중복 체크용 WordPress 색인 범위 (최근 수정일 기준)
+# 색인 요청 최대 페이지 수 (페이지당 100건): 이 워크플로우가 기간 내 올릴 수 있는 최대 글 수만큼만
+WP_INDEX_MAX_PAGES     = (DAILY_LIMIT * WP_INDEX_DAYS + 99) // 100
 
 # 실행 모드 감지
 GITHUB_EVENT_NAME = os.environ.get("GITHUB_EVENT_NAME", "workflow_dispatch")
@@ -45,6 +63,168 @@ IS_SCHEDULED      = GITHUB_EVENT_NAME == "schedule"
 POST_STATUS  = os.environ.get("POST_STATUS", "publish")
 GEMINI_MODEL = os.environ.get("GEMINI_MODEL", "gemini-2.5-flash-lite")
 
+# ==========================================
+# 본문 정리 패턴 (모듈 로드 시 1회 컴파일)
+# ==========================================
+REMOVE_HREF_RE = re.compile('|'.join(map(re.escape, [
+    'facebook.com', 'twitter.com', 'line.me', '/fellowship/', 'hatena.ne.jp'
+])))
+JAPANESE_KANA_RE = re.compile(r'[\u3040-\u309f\u30a0-\u30ff]')
+HTML_TAG_RE = re.compile(r'<[^>]+>')
+JSON_DECODER = json.JSONDecoder()
+# BeautifulSoup get_text(" ", strip=True)와 같은 결과 (script·style 텍스트 제외)
+TEXT_NODES_XPATH = etree.XPath('descendant-or-self::text()[not(ancestor::script or ancestor::style)]')
+PRONEWS_LINK_RE = re.compile(r'https?://jp\.pronews\.com/news/[^\s"\'<>]+')
+REMOVE_TEXT_RE = re.compile(
+    r'原文掲載時刻:|ソース:|バックナンバー|関連キーワード|この記事をシェア|FOLLOW US|画像をクリック|クリックすると拡大|※画像'
+)
+REMOVE_HEADINGS_RE = re.compile('|'.join(map(re.escape, [
+    'バックナンバー', 'この記事をシェア', 'FOLLOW US', '関連記事', '関連キーワード'
+])))
+VIDEO_SRC_RE = re.compile(r'youtube|youtu\.be|vimeo')
+SHARE_CLASS_RE = re.compile('|'.join(map(re.escape, [
+    'social-share', 'share-buttons', 'addtoany', 'sharedaddy', 'entry-footer', 'post-meta'
+])), re.IGNORECASE)
+COMMENT_LEAD_RE = re.compile(
+    r'.{0,30}(다음과 같이 말했다|이렇게 말했다|다음과 같이 밝혔다|아래와 같이 코멘트했다'
+    r'|다음과 같이 코멘트|이와 같이 말했다|다음과 같이 전했다)\s*[\.。]?\s*$'
+)
+SLUG_WORD_RE = re.compile(r'[a-zA-Z][a-zA-Z0-9]*|[0-9]+[a-zA-Z]+|[a-zA-Z]+[0-9]+')
+BRAND_SLUG = {
+    'ソニー': 'sony', 'キヤノン': 'canon', 'ニコン': 'nikon',
+    'タムロン': 'tamron', 'シグマ': 'sigma', 'フジフイルム': 'fujifilm',
+    'パナソニック': 'panasonic', 'オリンパス': 'olympus', 'ライカ': 'leica',
+    'ブラックマジック': 'blackmagic', 'アップル': 'apple', 'アドビ': 'adobe',
+    'ゴープロ': 'gopro', 'ドローン': 'drone', 'カメラ': 'camera',
+    'レンズ': 'lens', 'ミラーレス': 'mirrorless', '動画': 'video',
+    '映像': 'video', '写真': 'photo', '撮影': 'shooting',
+}
+# 대표 이미지 확장자 (URL에 없으면 Content-Type 으로 결정)
+IMAGE_CONTENT_TYPES = {
+    'image/jpeg': '.jpg', 'image/jpg': '.jpg', 'image/png': '.png',
+    'image/gif': '.gif', 'image/webp': '.webp',
+}
+IMAGE_EXTS = frozenset(['.jpg', '.jpeg', '.png', '.gif', '.webp'])
+
+# Gemini에 넘길 본문에서 남길 속성 (class·style·id·data-* 등은 토큰만 차지)
+KEEP_ATTRS = frozenset([
+    'href', 'src', 'srcset', 'sizes', 'loading', 'data-src', 'alt', 'title', 'width', 'height',
+    'allow', 'allowfullscreen', 'frameborder', 'colspan', 'rowspan',
+])
+
+# 기사 페이지에서 실제로 읽는 부분만 파싱 (헤더·내비·사이드바·푸터는 트리 생성 생략)
+ARTICLE_PART_CLASSES = frozenset([
+    'articleBody-inner', 'articleBody', 'entry-content', 'post-content',
+    'article-content', 'articleHeader-date',
+])
+
+
+def _is_article_part(name, attrs) -> bool:
+    if name in ('article', 'time'):
+        return True
+    if name == 'meta':
+        return attrs.get('property') == 'og:image'
+    classes = attrs.get('class') or ''
+    if isinstance(classes, str):
+        classes = classes.split()
+    return not ARTICLE_PART_CLASSES.isdisjoint(classes)
+
+
+ARTICLE_STRAINER = SoupStrainer(_is_article_part)
+# 아카이브 목록 페이지는 article 블록과 링크만 있으면 충분
+ARCHIVE_STRAINER = SoupStrainer(['article', 'a'])
+PAGE_LINK_STRAINER = SoupStrainer('a', href=True)
+ARCHIVE_PAGE_RE = re.compile(r'/news/page/(\d+)')
+NEWS_ID_LINK_RE = re.compile(r'/news/\d{10,}')
+
+NOISE_CLASSES = frozenset([
+    'articleAside', 'mainLayout-side', 'articleShareSticky',
+    'articleShare', 'relatedKeyword', 'relatedArticle', 'prnbox',
+])
+STRIP_TAGS = frozenset(['script', 'style', 'noscript', 'form', 'nav', 'aside', 'footer', 'header'])
+# 본문 상단 대표 이미지 영역 (앞쪽일수록 우선)
+MV_CLASSES = ['articleBody-mv', 'article-mv', 'post-thumbnail', 'entry-thumbnail', 'article-eye-catch']
+MV_CLASS_SET = frozenset(MV_CLASSES)
+SECTION_HEADING_TAGS = frozenset(['h1', 'h2', 'h3', 'h4'])
+EMPTY_CHECK_TAGS = frozenset(['p', 'div', 'span', 'li'])
+
+
+def _is_noise_tag(tag) -> bool:
+    if tag.name in STRIP_TAGS:
+        return True
+    if tag.name == 'iframe' and not VIDEO_SRC_RE.search(tag.get('src', '').lower()):
+        return True
+    return not NOISE_CLASSES.isdisjoint(tag.get('class') or ())
+
+
+# ==========================================
+# Gemini 프롬프트 (기사마다 f-string을 다시 조립하지 않도록 모듈 상수로 보관)
+# ==========================================
+TRANSLATE_PROMPT_TMPL = """당신은 영상·카메라·디지털 전문 미디어 proDG의 한국어 시니어 에디터입니다.
+아래 일본어 기사(HTML)를 한국어로 번역·편집하여 JSON으로만 출력하세요.
+
+=== 일본어 원문 ===
+제목: {title}
+
+본문:
+{body}
+
+=== 번역 규칙 ===
+1. 일본어(히라가나·가타카나·한자)를 완전히 한국어로 번역. 일본어가 한 글자도 남으면 안 됨.
+2. 문체: 반드시 '~다', '~했다', '~이다' 등 기사 형식의 평어체로 통일. '~합니다' 금지.
+3. 브랜드명·모델명 표기:
+   - 원문 영문 유지: Sony, Canon, Nikon, DJI, Blackmagic, Sigma, Tamron, Fujifilm 등
+   - タムロン→탐론, ソニー→소니, キヤノン→캐논, ニコン→니콘, パナソニック→파나소닉
+4. 기술 용어: 4K, 8K, Full HD, fps, RAW, ISO, f값, mm 등 원문 그대로 유지
+5. ★절대 금지★: <img>, <figure>, <picture>, <iframe>, <video> 태그와 src·alt·width·height 속성 수정·삭제
+6. 번역 품질 기준:
+   - 기계 번역 티가 나면 안 됨. 한국 전문 기자가 직접 쓴 것처럼 자연스럽게.
+   - 제품 스펙·수치는 정확하게 유지
+   - 문단 구조와 논리 흐름 유지
+   - Google AdSense 고품질 콘텐츠 기준 충족
+
+=== 출력 JSON 규칙 ===
+- title: SEO 최적화 제목 (브랜드명·모델명·핵심스펙 포함, 40~55자)
+- content: 번역 본문 (HTML 구조·이미지 태그 완벽 유지, 최소 300자 이상)
+- excerpt: 구글 스니펫용 요약 (핵심 정보 2문장, 80~120자, 평어체)
+- tldr: 핵심 요약 3~4항목 (<ul><li> HTML, 각 항목 구체적 수치·스펙 포함, 평어체)
+- 마크다운 백틱 없이 순수 JSON만 출력
+
+{{
+  "title": "SEO 제목",
+  "content": "<p>본문</p> <figure><img src='...'></figure>",
+  "excerpt": "요약문",
+  "tldr": "<ul><li>요약1</li><li>요약2</li><li>요약3</li></ul>"
+}}"""
+
+RETRANSLATE_PROMPT_TMPL = """아래 한국어 본문(HTML 포함)에 일본어가 섞여 있습니다.
+일본어 부분을 자연스러운 한국어 평어체(~다, ~했다, ~이다)로 번역하고 전체 본문을 반환하세요.
+★중요★ <img>, <figure> 등 모든 HTML 태그와 속성은 절대 건드리지 말고 그대로 유지할 것.
+본문만 출력:
+
+{body}"""
+
+TITLE_PROMPT_TMPL = """아래 일본어 기사 제목을 한국어 뉴스 제목으로 번역하세요.
+제품명·브랜드명은 원문 표기를 유지하고, 설명 없이 제목 한 줄만 출력:
+
+{title}"""
+
+# JSON 본문은 orjson으로 직접 직렬화해 data= 로 전송
+JSON_HEADERS = {'Content-Type': 'application/json'}
+
+# 게시 본문 조립용 블록 (요약 → 핵심 요약 → 본문 → 내부링크 → 원문 출처 순으로 1회 join)
+LEDE_TMPL = "<p style='font-size:15px;line-height:1.7;color:#222;margin:0 0 18px 0;'>{lede}</p>\n"
+TLDR_TMPL = (
+    '<div style="background:#f8f9fa;padding:20px;border-radius:8px;'
+    'border-left:5px solid #0056b3;margin-bottom:30px;">\n'
+    '<h3 style="margin-top:0;color:#0056b3;">💡 핵심 요약</h3>\n'
+    '{tldr}\n</div>\n\n'
+)
+SOURCE_FOOTER_TMPL = (
+    "\n\n<hr style='margin:40px 0 20px 0;border:0;border-top:1px solid #e0e0e0;'>\n"
+    "<p style='font-size:13px;color:#777;'><strong>원문:</strong> "
+    "<a href='{link}' target='_blank' rel='noopener'>{title}</a></p>"
+)
 
 # ==========================================
 # Gemini 통합 엔진
@@ -57,8 +237,34 @@ class GeminiEngine:
             sys.exit(1)
         self.last_call_time  = 0.0
         self.rate_limit_hit  = False
+        self._lock           = threading.Lock()
+        # 모든 호출·재시도가 같은 호스트로 가므로 연결(TCP+TLS)을 재사용
+        self.session         = requests.Session()
+        # 키는 쿼리스트링 대신 헤더로 1회 설정 (오류 메시지·로그에 URL과 함께 노출되지 않도록)
+        self.session.headers.update({'x-goog-api-key': self.api_key})
+
+    def check_api_key(self) -> bool:
+        """
+        토큰을 쓰지 않는 모델 조회(models.get)로 키·모델명만 확인한다.
+        키 오류(400/401/403)·모델 없음(404)일 때만 False, 네트워크 오류는 통과.
+        """
+        url = f"https://generativelanguage.googleapis.com/v1beta/models/{GEMINI_MODEL}"
+        try:
+            res = self.session.get(url, timeout=15)
+        except Exception as e:
+            print(f"⚠️ Gemini 키 확인 요청 실패 (계속 진행): {e}")
+            return True
+        if res.status_code in (400, 401, 403, 404):
+            print(f"   HTTP {res.status_code}: {res.text[:200]}")
+            return False
+        return True
 
     def _call_api(self, prompt: str, max_tokens: int = 8192) -> str:
+        # 여러 스레드에서 호출돼도 7초 간격·429 플래그가 유지되도록 직렬화
+        with self._lock:
+            return self._call_api_locked(prompt, max_tokens)
+
+    def _call_api_locked(self, prompt: str, max_tokens: int) -> str:
         if self.rate_limit_hit:
             return ""
 
@@ -69,7 +275,7 @@ class GeminiEngine:
 
         url = (
             f"https://generativelanguage.googleapis.com/v1beta/models/"
-            f"{GEMINI_MODEL}:generateContent?key={self.api_key}"
+            f"{GEMINI_MODEL}:generateContent"
         )
         payload = {
             "contents": [{"parts": [{"text": prompt}]}],
@@ -79,23 +285,23 @@ class GeminiEngine:
             }
         }
 
-        backoff = [15, 30, 60]
+        body = orjson.dumps(payload)   # 재시도해도 같은 본문이므로 1회만 직렬화
         for attempt in range(3):
             try:
-                res = requests.post(url, json=payload, timeout=120)
+                res = self.session.post(url, data=body, headers=JSON_HEADERS, timeout=120)
 
                 if res.status_code == 429:
-                    wait = backoff[min(attempt, len(backoff) - 1)]
-                    print(f"⚠️ 429 Rate Limit (시도 {attempt+1}/3) → {wait}초 대기...")
-                    time.sleep(wait)
                     if attempt == 2:
                         print("❌ 429 반복 → 런 종료 (미게시 기사는 다음 런 자동 이월)")
                         self.rate_limit_hit = True
                         return ""
+                    wait = self._backoff_seconds(attempt, res.headers.get('Retry-After'))
+                    print(f"⚠️ 429 Rate Limit (시도 {attempt+1}/3) → {wait:.1f}초 대기...")
+                    time.sleep(wait)
                     continue
 
                 res.raise_for_status()
-                candidates = res.json().get("candidates", [])
+                candidates = orjson.loads(res.content).get("candidates", [])
                 if candidates:
                     parts = candidates[0]["content"]["parts"]
                     for part in parts:
@@ -110,75 +316,67 @@ class GeminiEngine:
             except Exception as e:
                 print(f"⚠️ Gemini API 오류 (시도 {attempt+1}/3): {e}")
                 if attempt < 2:
-                    time.sleep(backoff[attempt])
+                    time.sleep(self._backoff_seconds(attempt))
 
         return ""
 
-    def translate_article(self, title_ja: str, body_text: str) -> dict:
-        prompt = f"""당신은 영상·카메라·디지털 전문 미디어 proDG의 한국어 시니어 에디터입니다.
-아래 일본어 기사(HTML)를 한국어로 번역·편집하여 JSON으로만 출력하세요.
-
-=== 일본어 원문 ===
-제목: {title_ja}
-
-본문:
-{body_text[:15000]}
-
-=== 번역 규칙 ===
-1. 일본어(히라가나·가타카나·한자)를 완전히 한국어로 번역. 일본어가 한 글자도 남으면 안 됨.
-2. 문체: 반드시 '~다', '~했다', '~이다' 등 기사 형식의 평어체로 통일. '~합니다' 금지.
-3. 브랜드명·모델명 표기:
-   - 원문 영문 유지: Sony, Canon, Nikon, DJI, Blackmagic, Sigma, Tamron, Fujifilm 등
-   - タムロン→탐론, ソニー→소니, キヤノン→캐논, ニコン→니콘, パナソニック→파나소닉
-4. 기술 용어: 4K, 8K, Full HD, fps, RAW, ISO, f값, mm 등 원문 그대로 유지
-5. ★절대 금지★: <img>, <figure>, <picture>, <iframe>, <video> 태그와 src·alt·width·height 속성 수정·삭제
-6. 번역 품질 기준:
-   - 기계 번역 티가 나면 안 됨. 한국 전문 기자가 직접 쓴 것처럼 자연스럽게.
-   - 제품 스펙·수치는 정확하게 유지
-   - 문단 구조와 논리 흐름 유지
-   - Google AdSense 고품질 콘텐츠 기준 충족
-
-=== 출력 JSON 규칙 ===
-- title: SEO 최적화 제목 (브랜드명·모델명·핵심스펙 포함, 40~55자)
-- content: 번역 본문 (HTML 구조·이미지 태그 완벽 유지, 최소 300자 이상)
-- excerpt: 구글 스니펫용 요약 (핵심 정보 2문장, 80~120자, 평어체)
-- tldr: 핵심 요약 3~4항목 (<ul><li> HTML, 각 항목 구체적 수치·스펙 포함, 평어체)
-- 마크다운 백틱 없이 순수 JSON만 출력
+    def _backoff_seconds(self, attempt: int, retry_after: str = None) -> float:
+        """
+        서버가 Retry-After(초)를 주면 따르되 최대 60초로 제한하고 (엔진 락을 쥔 채 대기하므로),
+        없으면 15 → 30 → 60초 지수 백오프에 0~2초 지터를 더한다.
+        """
+        if retry_after:
+            try:
+                return min(60.0, max(0.0, float(retry_after)))
+            except ValueError:
+                pass
+        return min(60, 15 * 2 ** attempt) + random.uniform(0, 2)
 
-{{
-  "title": "SEO 제목",
-  "content": "<p>본문</p> <figure><img src='...'></figure>",
-  "excerpt": "요약문",
-  "tldr": "<ul><li>요약1</li><li>요약2</li><li>요약3</li></ul>"
-}}"""
+    def translate_article(self, title_ja: str, body_text: str) -> dict:
+        prompt = TRANSLATE_PROMPT_TMPL.format(title=title_ja, body=body_text[:GEMINI_BODY_LIMIT])
 
         result = self._call_api(prompt, max_tokens=8192)
         if not result:
             return {}
 
         try:
-            clean = re.sub(r'```(?:json)?', '', result).strip().rstrip('`').strip()
-            match = re.search(r'(\{.*\})', clean, re.DOTALL)
-            if match:
-                return json.loads(match.group(1))
+            # ```json 펜스 등 앞뒤 잡음은 건너뛰고 첫 '{'부터 JSON 객체 하나만 선형 디코딩
+            start = result.find('{')
+            if start != -1:
+                data, _ = JSON_DECODER.raw_decode(result, start)
+                # 제목은 JSON 응답 안에서 함께 검증 (별도 재호출 없이 결정적으로 판정)
+                title = (data.get('title') or '').strip()
+                if len(title) < MIN_TITLE_LENGTH:
+                    # 본문은 살리고 제목만 1회 다시 요청 (실패하면 짧은 번역 제목 → 일본어 제목 순으로 사용)
+                    print(f"⚠️ 번역 제목 너무 짧음 ({len(title)}자 < {MIN_TITLE_LENGTH}자): '{title}' → 제목만 재요청")
+                    retried = self.translate_title(title_ja)
+                    if len(retried) >= MIN_TITLE_LENGTH:
+                        title = retried
+                    else:
+                        title = title or title_ja
+                data['title'] = title
+                return data
         except Exception as e:
             print(f"⚠️ JSON 파싱 실패: {e} | 원문: {result[:200]}")
 
         return {}
 
-    def retranslate_content(self, content_ko: str) -> str:
-        prompt = f"""아래 한국어 본문(HTML 포함)에 일본어가 섞여 있습니다.
-일본어 부분을 자연스러운 한국어 평어체(~다, ~했다, ~이다)로 번역하고 전체 본문을 반환하세요.
-★중요★ <img>, <figure> 등 모든 HTML 태그와 속성은 절대 건드리지 말고 그대로 유지할 것.
-본문만 출력:
+    def translate_title(self, title_ja: str) -> str:
+        result = self._call_api(TITLE_PROMPT_TMPL.format(title=title_ja), max_tokens=256)
+        # 첫 줄만 쓰고 따옴표·마크다운 장식은 제거
+        return result.splitlines()[0].strip(' "\'*#「」') if result else ""
 
-{content_ko[:15000]}"""
+    def retranslate_content(self, content_ko: str) -> str:
+        prompt = RETRANSLATE_PROMPT_TMPL.format(body=content_ko[:GEMINI_BODY_LIMIT])
         result = self._call_api(prompt, max_tokens=8192)
         return result if result else content_ko
 
     def _has_japanese(self, text: str) -> bool:
-        plain = BeautifulSoup(text, 'lxml').get_text()
-        return len(re.findall(r'[\u3040-\u309f\u30a0-\u30ff]', plain)) > 5
+        # 원문 HTML에 가나가 전혀 없으면 바로 통과 (대부분의 경우)
+        if not JAPANESE_KANA_RE.search(text):
+            return False
+        # 태그(특히 alt 속성)만 정규식으로 걷어내고 텍스트의 가나 수를 센다 (파서 불필요)
+        return len(JAPANESE_KANA_RE.findall(HTML_TAG_RE.sub(' ', text))) > 5
 
 
 # ==========================================
@@ -188,35 +386,135 @@ class NewsTranslator:
     def __init__(self):
         self.gemini          = GeminiEngine()
         self.wordpress_api   = f"{WORDPRESS_URL}/wp-json/wp/v2"
-        self.posted_articles = self.load_posted_articles()
+        self.posted_articles = self.load_posted_articles()   # 파일 저장 순서 유지용
+        self.posted_set      = set(self.posted_articles)      # O(1) 중복 판정용
+        self._posted_delta   = []                              # 이번 런에서 추가된 링크
+        self._posted_log     = None
+        self.session         = self._build_session()
+        # WordPress 전용 세션: 인증 정보를 세션에 고정해 prodg.kr keep-alive 연결을 재사용
+        # (pronews.jp 요청에는 자격 증명이 실리지 않도록 세션을 분리)
+        self.wp_session      = self._build_session()
+        self.wp_session.auth = (WORDPRESS_USER, WORDPRESS_APP_PASSWORD)
+        self._page_cache     = {}   # URL → 원문 HTML
+        self._scrape_cache   = {}   # URL → 정리된 (본문, 원문 시각, 대표 이미지) — 같은 런의 재처리용
+        self._wp_source_index = None
+        # 기사별 스크래핑 I/O(본문·대표 이미지·중복 체크)를 겹쳐 실행
+        self.executor        = ThreadPoolExecutor(max_workers=4)
+
+    def _build_session(self) -> requests.Session:
+        """
+        keep-alive 연결 풀을 갖춘 세션 생성 (pronews.jp용·WordPress용 공통 설정).
+        GET 등 멱등 요청은 일시 오류(429/5xx) 시 어댑터가 자동 재시도한다.
+        """
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=4, pool_maxsize=20,
+            max_retries=Retry(total=3, backoff_factor=1,
+                              status_forcelist=[429, 500, 502, 503, 504],
+                              raise_on_status=False)
+        )
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        session.headers.update({'User-Agent': 'Mozilla/5.0'})
+        return session
 
     def load_posted_articles(self) -> list:
+        posted = []
         if Path(POSTED_ARTICLES_FILE).exists():
-            with open(POSTED_ARTICLES_FILE, 'r') as f:
+            with open(POSTED_ARTICLES_FILE, 'rb') as f:
                 try:
-                    return json.load(f)
+                    posted = orjson.loads(f.read())
                 except:
-                    return []
-        return []
+                    posted = []
+        # 이전 런이 스냅샷 전에 중단됐다면 추가 기록(.log)을 이어 붙인다
+        log_path = Path(POSTED_ARTICLES_FILE + '.log')
+        if log_path.exists():
+            seen = set(posted)
+            for line in log_path.read_text().splitlines():
+                link = line.strip()
+                if link and link not in seen:
+                    seen.add(link)
+                    posted.append(link)
+        return posted
 
     def save_posted_articles(self):
-        with open(POSTED_ARTICLES_FILE, 'w') as f:
-            json.dump(self.posted_articles, f, indent=2)
+        """
+        전체 목록 스냅샷을 기록하고 추가 기록(.log)을 비운다. 런 종료 시 1회 호출.
+        임시 파일에 쓴 뒤 교체 → 쓰는 도중 런이 중단돼도 기존 기록이 깨지지 않음
+        """
+        tmp_path = POSTED_ARTICLES_FILE + '.tmp'
+        with open(tmp_path, 'wb') as f:
+            f.write(orjson.dumps(self.posted_articles, option=orjson.OPT_INDENT_2))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, POSTED_ARTICLES_FILE)
+        if self._posted_log is not None:
+            self._posted_log.close()
+            self._posted_log = None
+        Path(POSTED_ARTICLES_FILE + '.log').unlink(missing_ok=True)
+
+    def mark_posted(self, link: str):
+        # 기사마다 JSON 전체를 다시 쓰지 않고 한 줄만 추가 기록
+        if link in self.posted_set:
+            return
+        self.posted_set.add(link)
+        self.posted_articles.append(link)
+        self._posted_delta.append(link)
+        if self._posted_log is None:
+            self._posted_log = open(POSTED_ARTICLES_FILE + '.log', 'a')
+        self._posted_log.write(link + '\n')
+        self._posted_log.flush()
+
+    def load_rss_cache(self) -> dict:
+        if Path(RSS_CACHE_FILE).exists():
+            try:
+                with open(RSS_CACHE_FILE, 'rb') as f:
+                    return orjson.loads(f.read())
+            except:
+                pass
+        return {}
+
+    def save_rss_cache(self, cache: dict):
+        try:
+            with open(RSS_CACHE_FILE, 'wb') as f:
+                f.write(orjson.dumps(cache, option=orjson.OPT_INDENT_2))
+        except Exception as e:
+            print(f"⚠️ RSS 캐시 저장 실패: {e}")
 
     def fetch_rss_articles(self) -> list:
         print(f"📡 RSS 피드 확인: {PRONEWS_RSS}")
-        feed = feedparser.parse(PRONEWS_RSS)
+        # 지난 런의 ETag/Last-Modified로 조건부 요청 → 변경이 없으면 304로 다운로드·파싱 생략
+        cache = self.load_rss_cache()
+        feed = feedparser.parse(PRONEWS_RSS, etag=cache.get('etag'),
+                                modified=cache.get('modified'), agent='Mozilla/5.0')
+        if feed.get('status') == 304 and 'entries' in cache:
+            # 304에도 지난 런에서 처리하지 못한 기사가 남아 있을 수 있으므로 캐시한 항목을 재사용
+            print("   RSS 변경 없음 (304) → 캐시된 항목 사용")
+            entries = [
+                (e['title'], e['link'], datetime.fromisoformat(e['date'])) for e in cache['entries']
+            ]
+        else:
+            entries = []
+            for entry in feed.entries:
+                try:
+                    article_date = datetime(*entry.published_parsed[:6])
+                except:
+                    article_date = datetime.now()
+                entries.append((entry.title, entry.link, article_date))
+            if feed.get('etag') or feed.get('modified'):
+                self.save_rss_cache({
+                    'etag': feed.get('etag'),
+                    'modified': feed.get('modified'),
+                    'entries': [{'title': t, 'link': l, 'date': d.isoformat()} for t, l, d in entries],
+                })
+
         articles = []
-        for entry in feed.entries:
-            if not FORCE_UPDATE and entry.link in self.posted_articles:
+        for title, link, article_date in entries:
+            if not FORCE_UPDATE and link in self.posted_set:
                 continue
-            try:
-                article_date = datetime(*entry.published_parsed[:6])
-            except:
-                article_date = datetime.now()
             articles.append({
-                'title': entry.title,
-                'link': entry.link,
+                'title': title,
+                'link': link,
                 'date': article_date,
                 'source': 'rss'
             })
@@ -230,12 +528,12 @@ class NewsTranslator:
         if oldest_first:
             try:
                 print("   🔍 실제 마지막 페이지 번호 탐색 중...")
-                res = requests.get(f"{PRONEWS_ARCHIVE_BASE}/1/", headers={'User-Agent': 'Mozilla/5.0'}, timeout=10)
+                res = self.session.get(f"{PRONEWS_ARCHIVE_BASE}/1/", timeout=10)
                 if res.status_code == 200:
-                    soup = BeautifulSoup(res.text, 'lxml')
+                    soup = BeautifulSoup(res.text, 'lxml', parse_only=PAGE_LINK_STRAINER)
                     pages = []
                     for a in soup.find_all('a', href=True):
-                        match = re.search(r'/news/page/(\d+)', a['href'])
+                        match = ARCHIVE_PAGE_RE.search(a['href'])
                         if match:
                             pages.append(int(match.group(1)))
                     if pages:
@@ -246,85 +544,100 @@ class NewsTranslator:
 
         collected = []
         seen_links = set()
-        page = actual_max_page if oldest_first else 1
+        if oldest_first:
+            pages = list(range(actual_max_page, 0, -1))
+        else:
+            pages = list(range(1, ARCHIVE_MAX_PAGES + 1))
 
-        while len(collected) < need * 3 and 1 <= page <= ARCHIVE_MAX_PAGES:
-            url = f"{PRONEWS_ARCHIVE_BASE}/{page}/"
-            try:
-                res = requests.get(url, headers={'User-Agent': 'Mozilla/5.0'}, timeout=15)
+        # 페이지 다운로드·파싱은 ARCHIVE_FETCH_WORKERS개씩 병렬로, 결과 병합은 페이지 순서대로
+        # (동시 요청 수가 곧 속도 제한이므로 페이지마다 sleep 하지 않는다)
+        done = False
+        for i in range(0, len(pages), ARCHIVE_FETCH_WORKERS):
+            if done or len(collected) >= need * 3:
+                break
+            batch = [(page, self.executor.submit(self._fetch_archive_page, page))
+                     for page in pages[i:i + ARCHIVE_FETCH_WORKERS]]
+            for page, future in batch:
+                if done or len(collected) >= need * 3:
+                    future.cancel()
+                    continue
+                try:
+                    found = future.result()
+                except Exception as e:
+                    print(f"⚠️ 아카이브 페이지 {page} 오류: {e}")
+                    continue
 
-                if res.status_code == 404:
+                if found is None:
                     if oldest_first:
                         print(f"   페이지 {page} 없음 → 이전 페이지 탐색")
-                        page -= 1
-                        continue
-                    else:
-                        print(f"   페이지 {page} 없음 → 크롤링 종료")
-                        break
-
-                res.raise_for_status()
-                soup = BeautifulSoup(res.text, 'lxml')
-                found = []
-
-                # article 태그 기반 파싱
-                for article in soup.find_all('article'):
-                    a_tag = article.find('a', href=True)
-                    if not a_tag:
-                        continue
-                    link = a_tag['href']
-                    if not link.startswith('http'):
-                        link = urljoin("https://jp.pronews.com", link)
-                    if '/news/' not in link or link in seen_links:
-                        continue
-
-                    title_tag = article.find(['h2', 'h3', 'h1'])
-                    title = title_tag.get_text(strip=True) if title_tag else a_tag.get_text(strip=True)
-                    if not title:
                         continue
-
-                    date_tag = article.find('time')
-                    article_date = datetime.now()
-                    if date_tag:
-                        try:
-                            article_date = datetime.fromisoformat(
-                                date_tag.get('datetime', date_tag.get_text(strip=True))[:19]
-                            )
-                        except:
-                            pass
-
-                    found.append({'title': title, 'link': link, 'date': article_date, 'source': 'archive'})
-
-                # article 태그 없으면 URL 패턴으로 파싱
-                if not found:
-                    for a in soup.find_all('a', href=True):
-                        href = a['href']
-                        if not href.startswith('http'):
-                            href = urljoin("https://jp.pronews.com", href)
-                        if re.search(r'/news/\d{10,}', href) and href not in seen_links:
-                            title = a.get_text(strip=True)
-                            if title and len(title) > 5:
-                                found.append({'title': title, 'link': href,
-                                              'date': datetime.now(), 'source': 'archive'})
+                    print(f"   페이지 {page} 없음 → 크롤링 종료")
+                    done = True
+                    continue
 
                 for art in found:
                     if art['link'] not in seen_links:
                         seen_links.add(art['link'])
-                        if FORCE_UPDATE or art['link'] not in self.posted_articles:
+                        if FORCE_UPDATE or art['link'] not in self.posted_set:
                             collected.append(art)
 
                 print(f"   페이지 {page}: {len(found)}건 발견, 누적 미게시: {len(collected)}건")
-                page = page - 1 if oldest_first else page + 1
-                time.sleep(1)
-
-            except Exception as e:
-                print(f"⚠️ 아카이브 페이지 {page} 오류: {e}")
-                page = page - 1 if oldest_first else page + 1
 
         collected.sort(key=lambda x: x['date'], reverse=not oldest_first)
         result = collected[:need]
         print(f"   아카이브 수집 완료: {len(result)}건")
         return result
 
+    def _fetch_archive_page(self, page: int):
+        """아카이브 1페이지 다운로드·파싱 (executor 스레드에서 실행). 반환: 기사 목록, 404면 None"""
+        res = self.session.get(f"{PRONEWS_ARCHIVE_BASE}/{page}/", timeout=15)
+        if res.status_code == 404:
+            return None
+        res.raise_for_status()
+        soup = BeautifulSoup(res.text, 'lxml', parse_only=ARCHIVE_STRAINER)
+        found = []
+
+        # article 태그 기반 파싱
+        for article in soup.find_all('article'):
+            a_tag = article.find('a', href=True)
+            if not a_tag:
+                continue
+            link = a_tag['href']
+            if not link.startswith('http'):
+                link = urljoin("https://jp.pronews.com", link)
+            if '/news/' not in link:
+                continue
+
+            title_tag = article.find(['h2', 'h3', 'h1'])
+            title = title_tag.get_text(strip=True) if title_tag else a_tag.get_text(strip=True)
+            if not title:
+                continue
+
+            date_tag = article.find('time')
+            article_date = datetime.now()
+            if date_tag:
+                try:
+                    article_date = datetime.fromisoformat(
+                        date_tag.get('datetime', date_tag.get_text(strip=True))[:19]
+                    )
+                except:
+                    pass
+
+            found.append({'title': title, 'link': link, 'date': article_date, 'source': 'archive'})
+
+        # article 태그 없으면 URL 패턴으로 파싱
+        if not found:
+            for a in soup.find_all('a', href=True):
+                href = a['href']
+                if not href.startswith('http'):
+                    href = urljoin("https://jp.pronews.com", href)
+                if NEWS_ID_LINK_RE.search(href):
+                    title = a.get_text(strip=True)
+                    if title and len(title) > 5:
+                        found.append({'title': title, 'link': href,
+                                      'date': datetime.now(), 'source': 'archive'})
+        return found
+
     def get_articles_to_process(self) -> list:
         if IS_SCHEDULED:
             print("🕐 자동 실행: 최신 우선 + 아카이브 보충")
@@ -346,13 +659,71 @@ class NewsTranslator:
         print(f"✅ 처리 대상: {len(target)}건")
         return target
 
-    def fetch_full_content(self, url: str):
+    def _log(self, log, message: str):
+        # executor 스레드에서는 메시지를 모아두고, 처리 중인 기사 헤더 아래에서 한꺼번에 출력
+        if log is None:
+            print(message)
+        else:
+            log.append(message)
+
+    def _fetch_and_parse(self, url: str, log=None):
+        """
+        기사 페이지를 1회만 받아 파싱한다. (본문·og:image 추출이 같은 트리를 공유)
+        HTML은 URL별로 캐시하며, 실패하면 (None, "") 반환.
+        """
         try:
-            print(f"📄 스크래핑: {url}")
-            res = requests.get(url, headers={'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64)'}, timeout=15)
-            res.raise_for_status()
-            soup = BeautifulSoup(res.text, 'lxml')
+            html_text = self._page_cache.get(url)
+            if html_text is None:
+                self._log(log, f"📄 스크래핑: {url}")
+                res = self.session.get(url, headers={'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64)'}, timeout=15)
+                res.raise_for_status()
+                html_text = res.text
+                self._page_cache[url] = html_text
+            return BeautifulSoup(html_text, 'lxml', parse_only=ARTICLE_STRAINER), html_text
+        except Exception as e:
+            self._log(log, f"⚠️ 스크래핑 실패: {e}")
+            return None, ""
+
+    def _scrape_article(self, url: str):
+        """
+        다운로드·파싱·og:image 추출·본문 정리까지 한 번에 수행 (executor 스레드에서 실행).
+        반환: (본문 HTML, 원문 시각, 대표 이미지 URL, 로그 메시지 목록)
+        로그는 이 기사를 처리할 때 process_article이 출력한다 (다른 기사 출력 사이에 섞이지 않도록).
+        """
+        cached = self._scrape_cache.get(url)
+        if cached is not None:
+            return cached
+        log = []
+        soup, _ = self._fetch_and_parse(url, log)
+        if soup is None:
+            return "", None, None, log
+        # 같은 트리에서 og:image를 먼저 읽고(본문 정리 전) 본문을 추출
+        img_url = self.get_main_image_url(url, soup)
+        body_text, exact_date = self.fetch_full_content(url, soup, log)
+        result = (body_text, exact_date, img_url, log)
+        if body_text:
+            # 정리까지 끝난 결과를 보관해 같은 URL은 재다운로드·재파싱·재정리 없이 재사용 (로그는 재출력하지 않음)
+            self._scrape_cache[url] = (body_text, exact_date, img_url, [])
+        return result
 
+    def _prepare_article(self, url: str):
+        """
+        WordPress 중복 체크 → 미게시일 때만 스크래핑 (executor 스레드에서 실행, run()이 미리 시작).
+        중복이면 페이지를 받지 않는다. 반환: (중복 여부, 본문 HTML, 원문 시각, 대표 이미지 URL, 로그)
+        """
+        log = []
+        if not FORCE_UPDATE and self.is_already_posted_on_wp(url, log):
+            return True, "", None, None, log
+        body_text, exact_date, img_url, scrape_log = self._scrape_article(url)
+        return False, body_text, exact_date, img_url, log + scrape_log
+
+    def fetch_full_content(self, url: str, soup=None, log=None):
+        # soup를 넘기면 그 트리를 직접 정리한다 (og:image 등은 먼저 읽어둘 것)
+        if soup is None:
+            soup, _ = self._fetch_and_parse(url, log)
+            if soup is None:
+                return "", None
+        try:
             article_date = None
             time_tag = soup.find('time', datetime=True)
             if time_tag:
@@ -380,99 +751,108 @@ class NewsTranslator:
             if not content_div:
                 return "", None
 
-            noise_classes = [
-                'articleAside', 'mainLayout-side', 'articleShareSticky',
-                'articleShare', 'relatedKeyword', 'relatedArticle', 'prnbox'
-            ]
-            for noise_class in noise_classes:
-                for noise in content_div.find_all(class_=noise_class):
-                    noise.decompose()
-
-            removed = False
-            for mv_class in ['articleBody-mv', 'article-mv', 'post-thumbnail',
-                             'entry-thumbnail', 'article-eye-catch']:
-                mv_area = content_div.find(class_=mv_class)
-                if mv_area:
-                    mv_area.decompose()
-                    print(f"🗑️ 본문 상단 이미지 제거 ({mv_class})")
-                    removed = True
-                    break
-
-            if not removed:
-                first_child = content_div.find(recursive=False)
-                if first_child and first_child.name in ['figure', 'picture']:
-                    first_child.decompose()
-                    print("🗑️ 본문 최상단 figure 제거")
-                elif first_child and first_child.name == 'img':
-                    first_child.decompose()
-                    print("🗑️ 본문 최상단 img 제거")
-                elif first_child and first_child.name in ['div', 'p']:
-                    inner = first_child.find_all(recursive=False)
-                    if len(inner) == 1 and inner[0].name in ['img', 'figure', 'picture']:
-                        first_child.decompose()
-                        print("🗑️ 본문 최상단 이미지 래퍼 제거")
-
-            for elem in content_div.find_all(string=re.compile(
-                r'原文掲載時刻:|ソース:|バックナンバー|関連キーワード|この記事をシェア|FOLLOW US|画像をクリック|クリックすると拡大|※画像'
-            )):
-                parent = elem.find_parent()
-                if parent:
-                    parent.decompose()
-
-            for h_tag in content_div.find_all(['h2', 'h3', 'h4']):
-                if any(kw in h_tag.get_text(strip=True) for kw in
-                       ['バックナンバー', 'この記事をシェア', 'FOLLOW US', '関連記事', '関連キーワード']):
-                    next_elem = h_tag.find_next_sibling()
-                    h_tag.decompose()
-                    while next_elem and next_elem.name not in ['h1', 'h2', 'h3', 'h4']:
-                        temp = next_elem.find_next_sibling()
-                        next_elem.decompose()
-                        next_elem = temp
-
-            for tag in content_div(['script', 'style', 'noscript', 'form', 'nav', 'aside', 'footer', 'header']):
-                tag.decompose()
+            self._clean_content(content_div, log)
+            return str(content_div), article_date
 
-            for iframe in list(content_div.find_all('iframe')):
-                if not any(v in iframe.get('src', '').lower() for v in ['youtube', 'youtu.be', 'vimeo']):
-                    iframe.decompose()
+        except Exception as e:
+            self._log(log, f"⚠️ 스크래핑 실패: {e}")
+            return "", None
 
-            for elem in content_div.find_all(class_=lambda x: x and any(
-                sc in ' '.join(x).lower() for sc in
-                ['social-share', 'share-buttons', 'addtoany', 'sharedaddy', 'entry-footer', 'post-meta']
-            )):
-                elem.decompose()
+    def _clean_content(self, content_div, log=None):
+        """
+        본문 영역에서 광고·공유·관련기사·상단 이미지 등을 걷어내고 속성을 정리한다.
+        트리만 변경하는 순수 CPU 작업이라 스크래핑 스레드에서 그대로 실행된다.
+        """
+        # 1회 순회로 노이즈 태그(광고·불필요 태그·비동영상 iframe)와 상단 이미지 후보를 함께 수집
+        noise, mv_areas = [], {}
+        for tag in content_div.find_all(True):
+            if _is_noise_tag(tag):
+                noise.append(tag)
+                continue
+            for c in tag.get('class') or ():
+                if c in MV_CLASS_SET:
+                    mv_areas.setdefault(c, []).append(tag)
+        self._decompose_all(noise)
+
+        # 상단 이미지는 MV_CLASSES 우선순위대로 하나만 제거
+        # (클래스별 후보 중 노이즈와 함께 사라지지 않은 첫 태그 = 노이즈 제거 후 find 결과)
+        removed = False
+        for mv_class in MV_CLASSES:
+            mv_area = next((tag for tag in mv_areas.get(mv_class, ()) if not tag.decomposed), None)
+            if mv_area is not None:
+                mv_area.decompose()
+                self._log(log, f"🗑️ 본문 상단 이미지 제거 ({mv_class})")
+                removed = True
+                break
 
-            for a in list(content_div.find_all('a')):
-                href = a.get('href', '')
-                if any(kw in href.lower() for kw in
-                       ['facebook.com', 'twitter.com', 'line.me', '/fellowship/', 'hatena.ne.jp']) \
-                        or href.startswith('//') or not a.get_text(strip=True):
-                    a.decompose()
+        if not removed:
+            first_child = content_div.find(recursive=False)
+            if first_child and first_child.name in ['figure', 'picture']:
+                first_child.decompose()
+                self._log(log, "🗑️ 본문 최상단 figure 제거")
+            elif first_child and first_child.name == 'img':
+                first_child.decompose()
+                self._log(log, "🗑️ 본문 최상단 img 제거")
+            elif first_child and first_child.name in ['div', 'p']:
+                inner = first_child.find_all(recursive=False)
+                if len(inner) == 1 and inner[0].name in ['img', 'figure', 'picture']:
+                    first_child.decompose()
+                    self._log(log, "🗑️ 본문 최상단 이미지 래퍼 제거")
 
-            for tag_name in ['p', 'div', 'span', 'li']:
-                for tag in content_div.find_all(tag_name):
-                    if not tag.get_text(strip=True) and not tag.find('img'):
-                        tag.decompose()
+        # 부모 목록을 먼저 확정한 뒤 제거 (제거된 부모 안의 문자열은 .parent를 읽을 수 없음)
+        parents = [elem.parent for elem in content_div.find_all(string=REMOVE_TEXT_RE)]
+        self._decompose_all(p for p in parents if p is not None)
 
-            return str(content_div), article_date
+        for h_tag in content_div.find_all(['h2', 'h3', 'h4']):
+            if h_tag.decomposed:
+                continue
+            if REMOVE_HEADINGS_RE.search(h_tag.get_text(strip=True)):
+                next_elem = h_tag.find_next_sibling()
+                h_tag.decompose()
+                while next_elem and next_elem.name not in SECTION_HEADING_TAGS:
+                    temp = next_elem.find_next_sibling()
+                    next_elem.decompose()
+                    next_elem = temp
+
+        # 공유·메타 영역(class 패턴)과 불필요 링크를 1회 순회로 수집 후 일괄 제거
+        to_drop = []
+        for tag in content_div.find_all(True):
+            classes = tag.get('class')
+            if classes and SHARE_CLASS_RE.search(' '.join(classes)):
+                to_drop.append(tag)
+            elif tag.name == 'a':
+                href = tag.get('href', '')
+                if REMOVE_HREF_RE.search(href.lower()) \
+                        or href.startswith('//') or not tag.get_text(strip=True):
+                    to_drop.append(tag)
+        self._decompose_all(to_drop)
+
+        # 1회 순회로 빈 태그를 제거하면서, 남는 태그는 속성 정리
+        # (번역 입력 토큰 절감: 15000자 한도 안에 본문 텍스트가 더 많이 들어가도록)
+        # 텍스트·img가 없는 태그는 하위 트리 전체가 비어 있으므로 바깥 태그부터 제거하고
+        # 함께 사라진 자손은 건너뛴다 (역순 순회처럼 자손마다 get_text를 다시 하지 않음)
+        for tag in content_div.find_all(True):
+            if tag.decomposed:
+                continue
+            if tag.name in EMPTY_CHECK_TAGS and not tag.get_text(strip=True) and not tag.find('img'):
+                tag.decompose()
+                continue
+            tag.attrs = {k: v for k, v in tag.attrs.items() if k in KEEP_ATTRS}
+        content_div.attrs = {k: v for k, v in content_div.attrs.items() if k in KEEP_ATTRS}
 
-        except Exception as e:
-            print(f"⚠️ 스크래핑 실패: {e}")
-            return "", None
+    def _decompose_all(self, tags):
+        """
+        수집해 둔 태그를 한 번에 제거한다.
+        이미 제거된 상위 태그에 속한 태그는 건너뛰어 하위 트리를 중복 순회하지 않는다.
+        """
+        for tag in tags:
+            if not tag.decomposed:
+                tag.decompose()
 
     def generate_seo_slug(self, title_ko: str, article_date: datetime, title_ja: str = "") -> str:
         date_str = article_date.strftime('%Y%m%d') if article_date else datetime.now().strftime('%Y%m%d')
-        BRAND_SLUG = {
-            'ソニー': 'sony', 'キヤノン': 'canon', 'ニコン': 'nikon',
-            'タムロン': 'tamron', 'シグマ': 'sigma', 'フジフイルム': 'fujifilm',
-            'パナソニック': 'panasonic', 'オリンパス': 'olympus', 'ライカ': 'leica',
-            'ブラックマジック': 'blackmagic', 'アップル': 'apple', 'アドビ': 'adobe',
-            'ゴープロ': 'gopro', 'ドローン': 'drone', 'カメラ': 'camera',
-            'レンズ': 'lens', 'ミラーレス': 'mirrorless', '動画': 'video',
-            '映像': 'video', '写真': 'photo', '撮影': 'shooting',
-        }
         def extract_english(text: str) -> str:
-            words = re.findall(r'[a-zA-Z][a-zA-Z0-9]*|[0-9]+[a-zA-Z]+|[a-zA-Z]+[0-9]+', text)
+            words = SLUG_WORD_RE.findall(text)
             filtered = [w.lower() for w in words if len(w) >= 2]
             return '-'.join(filtered[:6])
         slug = extract_english(title_ko)
@@ -482,16 +862,19 @@ class NewsTranslator:
             brand_words = [en for ja, en in BRAND_SLUG.items() if ja in title_ja]
             if brand_words:
                 slug = '-'.join(brand_words[:3])
-        slug = re.sub(r'-+', '-', slug).strip('-')
-        return f"{slug[:50]}-{date_str}" if len(slug) >= 3 else f"news-{date_str}"
+        # 토큰이 영숫자뿐이라 '-' 중복이 생기지 않으므로 별도 정규식 정리 없이 길이만 자른다
+        slug = slug[:50].rstrip('-')
+        return f"{slug}-{date_str}" if len(slug) >= 3 else f"news-{date_str}"
 
-    def get_main_image_url(self, link: str):
+    def get_main_image_url(self, link: str, soup=None):
         try:
-            res = requests.get(link, headers={'User-Agent': 'Mozilla/5.0'}, timeout=10)
-            soup = BeautifulSoup(res.text, 'lxml')
+            if soup is None:
+                soup, _ = self._fetch_and_parse(link)
+                if soup is None:
+                    return None
             og = soup.find('meta', property='og:image')
             if og and og.get('content'):
-                return og['content']
+                return urljoin(link, og['content'].strip())
             content = soup.find('div', class_='entry-content')
             if content:
                 img = content.find('img')
@@ -502,85 +885,151 @@ class NewsTranslator:
             pass
         return None
 
-    def download_image(self, url: str):
+    def download_image(self, url: str, log=None):
         if not url:
             return None
         try:
-            print(f"🖼️ 이미지 다운로드: {url}")
-            res = requests.get(url, headers={'User-Agent': 'Mozilla/5.0'}, timeout=15)
-            res.raise_for_status()
-            url_hash = hashlib.md5(url.encode()).hexdigest()[:8]
-            ext = os.path.splitext(os.path.basename(urlparse(url).path).split('?')[0])[1]
-            if ext not in ['.jpg', '.jpeg', '.png', '.gif', '.webp']:
-                ext = '.jpg'
-            path = Path(f"/tmp/pronews_{int(time.time())}_{url_hash}{ext}")
-            with open(path, 'wb') as f:
-                f.write(res.content)
-            print(f"   ✅ {path.name}")
+            self._log(log, f"🖼️ 이미지 다운로드: {url}")
+            url_hash = hashlib.blake2b(url.encode(), digest_size=4).hexdigest()
+            ext = os.path.splitext(urlparse(url).path)[1].lower()
+            # 응답 전체를 메모리에 올리지 않고 64KB 단위로 바로 디스크에 기록
+            with self.session.get(url, timeout=15, stream=True) as res:
+                res.raise_for_status()
+                if ext not in IMAGE_EXTS:
+                    # URL 경로에 확장자가 없으면 Content-Type 으로 판단
+                    content_type = res.headers.get('Content-Type', '').split(';')[0].strip().lower()
+                    ext = IMAGE_CONTENT_TYPES.get(content_type, '.jpg')
+                path = Path(f"/tmp/pronews_{int(time.time())}_{url_hash}{ext}")
+                res.raw.decode_content = True
+                try:
+                    with open(path, 'wb') as f:
+                        shutil.copyfileobj(res.raw, f, length=64 * 1024)
+                except Exception:
+                    path.unlink(missing_ok=True)
+                    raise
+            self._log(log, f"   ✅ {path.name}")
             return path
         except Exception as e:
-            print(f"⚠️ 이미지 다운로드 실패: {e}")
+            self._log(log, f"⚠️ 이미지 다운로드 실패: {e}")
             return None
 
-    def upload_media(self, image_path: Path):
+    def upload_media(self, image_path: Path, log=None):
         if not image_path or not image_path.exists():
             return None
         try:
+            # multipart 본문을 메모리에 조립하지 않고 파일을 요청 본문으로 그대로 스트리밍
+            # (WP REST /media는 Content-Disposition + Content-Type 헤더의 raw 업로드를 지원)
+            content_type = mimetypes.guess_type(image_path.name)[0] or 'image/jpeg'
             with open(image_path, 'rb') as img:
-                res = requests.post(
+                res = self.wp_session.post(
                     f"{self.wordpress_api}/media",
-                    auth=(WORDPRESS_USER, WORDPRESS_APP_PASSWORD),
-                    headers={'Content-Disposition': f'attachment; filename={image_path.name}'},
-                    files={'file': (image_path.name, img, 'image/jpeg')}
+                    headers={'Content-Disposition': f'attachment; filename={image_path.name}',
+                             'Content-Type': content_type},
+                    data=img
                 )
                 res.raise_for_status()
-                return res.json()
+                return orjson.loads(res.content)
         except Exception as e:
-            print(f"⚠️ 미디어 업로드 실패: {e}")
+            self._log(log, f"⚠️ 미디어 업로드 실패: {e}")
             return None
 
-    def is_already_posted_on_wp(self, original_url: str) -> bool:
+    def is_already_posted_on_wp(self, original_url: str, log=None) -> bool:
+        # 이 워크플로우가 게시한 기록이 있으면 WordPress 검색 생략
+        # (원격에서 찾은 중복은 호출부가 mark_posted로 로컬 기록에 반영)
+        if original_url in self.posted_set:
+            self._log(log, "⚠️ 중복 감지(로컬 기록) → 스킵")
+            return True
+        # 런 시작 시 1회 받아둔 최근 게시글 색인이 있으면 기사별 검색 없이 판정
+        # (색인은 최근 WP_INDEX_DAYS일 분량 — 그 이전 게시분은 위의 로컬 기록으로 판정)
+        if self._wp_source_index is not None:
+            if original_url in self._wp_source_index:
+                self._log(log, f"⚠️ 중복 감지 → 스킵: {self._wp_source_index[original_url]}")
+                return True
+            return False
+        # 색인 로드에 실패한 경우에만 기사별 검색
         try:
             search_term = original_url.split('/')[-2] if original_url.endswith('/') else original_url.split('/')[-1]
-            res = requests.get(
+            res = self.wp_session.get(
                 f"{self.wordpress_api}/posts",
-                auth=(WORDPRESS_USER, WORDPRESS_APP_PASSWORD),
                 params={'search': search_term, 'per_page': 5, 'status': 'any'},
                 timeout=10
             )
             if res.status_code == 200:
-                for post in res.json():
+                for post in orjson.loads(res.content):
                     if original_url in post.get('content', {}).get('rendered', ''):
-                        print(f"⚠️ 중복 감지 → 스킵: {post['link']}")
+                        self._log(log, f"⚠️ 중복 감지 → 스킵: {post['link']}")
                         return True
             return False
         except Exception as e:
-            print(f"⚠️ 중복 체크 오류 (계속 진행): {e}")
+            self._log(log, f"⚠️ 중복 체크 오류 (계속 진행): {e}")
             return False
 
+    def load_wp_source_index(self):
+        """
+        최근 WP_INDEX_DAYS일 안에 생성·수정된 WordPress 글을 100건 단위로 훑어
+        본문 속 pronews 원문 URL → 게시글 링크 색인을 만든다. 실패하면 None.
+        (게시 날짜는 원문 시각으로 소급되므로 date가 아닌 modified 기준으로 자른다)
+        색인에 없으면 미게시로 판정하므로, 그보다 오래된 게시분은 로컬 기록(posted_articles.json)에 의존한다.
+        """
+        cutoff = (datetime.now() - timedelta(days=WP_INDEX_DAYS)).strftime('%Y-%m-%dT%H:%M:%S')
+        index = {}
+        try:
+            for page in range(1, WP_INDEX_MAX_PAGES + 1):
+                res = self.wp_session.get(
+                    f"{self.wordpress_api}/posts",
+                    params={'per_page': 100, 'page': page, 'status': 'any',
+                            'orderby': 'id', 'order': 'desc', 'modified_after': cutoff,
+                            '_fields': 'link,content'},
+                    timeout=15
+                )
+                if res.status_code != 200:
+                    if page == 1:
+                        print(f"⚠️ 게시글 색인 로드 실패 (HTTP {res.status_code}) → 기사별 검색으로 대체")
+                        return None
+                    break
+                posts = orjson.loads(res.content)
+                for post in posts:
+                    for src in PRONEWS_LINK_RE.findall(post.get('content', {}).get('rendered', '')):
+                        index.setdefault(src, post.get('link', ''))
+                if len(posts) < 100 or page >= int(res.headers.get('X-WP-TotalPages', page)):
+                    break
+            print(f"   WordPress 최근 게시글 색인: 원문 {len(index)}건")
+            return index
+        except Exception as e:
+            print(f"⚠️ 게시글 색인 로드 오류 → 기사별 검색으로 대체: {e}")
+            return None
+
     def commit_posted_articles(self):
         try:
             import subprocess
-            subprocess.run(['git', 'config', 'user.email', 'action@github.com'], check=True)
-            subprocess.run(['git', 'config', 'user.name', 'GitHub Action'], check=True)
-            subprocess.run(['git', 'add', POSTED_ARTICLES_FILE], check=True)
-            result = subprocess.run(['git', 'diff', '--cached', '--quiet'], capture_output=True)
+            # 작성자 정보는 -c 로 커밋에만 전달 (git config 프로세스 2회 생략, 저장소 설정 불변)
+            git_identity = ['-c', 'user.email=action@github.com', '-c', 'user.name=GitHub Action']
+            tracked = [POSTED_ARTICLES_FILE] + ([RSS_CACHE_FILE] if Path(RSS_CACHE_FILE).exists() else [])
+            subprocess.run(['git', 'add', *tracked], check=True)
+            # 호출부가 새 기록이 있을 때만 부르므로 diff --cached 확인은 생략 (실패 코드는 실제 오류)
+            result = subprocess.run(['git', *git_identity, 'commit', '-q', '-m',
+                f'chore: update posted_articles [{datetime.now().strftime("%Y-%m-%d %H:%M")}]'],
+                capture_output=True, text=True)
             if result.returncode != 0:
-                subprocess.run(['git', 'commit', '-m',
-                    f'chore: update posted_articles [{datetime.now().strftime("%Y-%m-%d %H:%M")}]'], check=True)
-                subprocess.run(['git', 'push'], check=True)
-                print("📝 posted_articles.json → git 커밋 완료")
+                detail = (result.stderr or result.stdout).strip() or f"exit {result.returncode}"
+                print(f"⚠️ git 커밋 실패: {detail}")
+                return
+            subprocess.run(['git', 'push'], check=True)
+            print("📝 posted_articles.json → git 커밋 완료")
         except Exception as e:
             print(f"⚠️ git 커밋 실패: {e}")
 
 
     def _strip_html(self, html_text: str) -> str:
+        # 트리 수정 없이 텍스트만 필요하므로 BeautifulSoup 대신 lxml로 바로 추출
+        # (관련 글 후보 60건의 제목에도 매번 호출되는 경로)
+        if not html_text or not html_text.strip():
+            return ""
         try:
-            soup = BeautifulSoup(html_text or "", "lxml")
-            text = soup.get_text(" ", strip=True)
+            text = " ".join(TEXT_NODES_XPATH(lxml.html.fromstring(html_text)))
             return re.sub(r"\s+", " ", text).strip()
         except Exception:
-            return (html_text or "").strip()
+            return html_text.strip()
 
     def build_lede_summary(self, excerpt: str, tldr_html: str) -> str:
         """
@@ -609,14 +1058,14 @@ class NewsTranslator:
         실패하면 빈 리스트 반환.
         """
         try:
-            res = requests.get(
+            res = self.wp_session.get(
                 f"{self.wordpress_api}/posts",
                 params={"per_page": per_page, "status": "publish"},
                 timeout=10
             )
             if res.status_code != 200:
                 return []
-            return res.json()
+            return orjson.loads(res.content)
         except Exception:
             return []
 
@@ -700,14 +1149,14 @@ class NewsTranslator:
         if excerpt:
             post_data['excerpt'] = excerpt
         try:
-            res = requests.post(
+            res = self.wp_session.post(
                 f"{self.wordpress_api}/posts",
-                auth=(WORDPRESS_USER, WORDPRESS_APP_PASSWORD),
-                json=post_data
+                data=orjson.dumps(post_data),
+                headers=JSON_HEADERS
             )
             res.raise_for_status()
             label = "📝 임시저장" if status == "draft" else "✨ 게시 성공"
-            print(f"{label} ({target_date}): {res.json()['link']}")
+            print(f"{label} ({target_date}): {orjson.loads(res.content)['link']}")
             return True
         except Exception as e:
             print(f"❌ 게시 실패: {e}")
@@ -715,7 +1164,51 @@ class NewsTranslator:
                 print(f"   {e.response.text[:300]}")
             return False
 
-    def process_article(self, article: dict) -> bool:
+    def _prepare_featured_image(self, img_url: str):
+        """
+        대표 이미지 다운로드 → 미디어 업로드 (executor 스레드에서 실행).
+        반환: (미디어 ID (실패 시 0), 로그 메시지 목록) — 로그는 호출 스레드가 출력
+        """
+        log = []
+        featured_id = 0
+        if img_url:
+            local_img = self.download_image(img_url, log)
+            if local_img:
+                media_info = self.upload_media(local_img, log)
+                if media_info:
+                    featured_id = media_info['id']
+                try:
+                    local_img.unlink()
+                except:
+                    pass
+        return featured_id, log
+
+    def _collect_featured_image(self, image_future) -> int:
+        """특성 이미지 작업 결과를 받아 진행 로그를 현재 기사 아래에 출력하고 미디어 ID를 반환"""
+        print("🔍 특성 이미지(Featured Image) 처리 중...")
+        featured_id, log = image_future.result()
+        for line in log:
+            print(line)
+        return featured_id
+
+    def _discard_featured_image(self, image_future):
+        """게시를 포기한 기사의 특성 이미지가 미디어 라이브러리에 남지 않도록 삭제"""
+        if image_future.cancel():
+            return
+        self._delete_media(self._collect_featured_image(image_future))
+
+    def _delete_media(self, media_id: int):
+        if not media_id:
+            return
+        try:
+            res = self.wp_session.delete(f"{self.wordpress_api}/media/{media_id}",
+                                         params={'force': 'true'}, timeout=15)
+            res.raise_for_status()
+            print(f"   🗑️ 업로드한 특성 이미지 삭제 (ID {media_id})")
+        except Exception as e:
+            print(f"⚠️ 특성 이미지 삭제 실패: {e}")
+
+    def process_article(self, article: dict, page_future=None) -> bool:
         print(f"\n{'='*60}")
         print(f"📰 {article['title'][:70]}")
         print(f"📅 {article['date'].strftime('%Y-%m-%d %H:%M')} [{article.get('source','?')}]")
@@ -725,13 +1218,17 @@ class NewsTranslator:
             print("🛑 429 플래그 → 다음 런 이월")
             return False
 
-        if not FORCE_UPDATE and self.is_already_posted_on_wp(article['link']):
-            if article['link'] not in self.posted_articles:
-                self.posted_articles.append(article['link'])
-                self.save_posted_articles()
+        # 중복 체크 + 스크래핑(다운로드·파싱·정리) 작업 (run()이 미리 시작했으면 그대로 사용)
+        if page_future is None:
+            page_future = self.executor.submit(self._prepare_article, article['link'])
+
+        duplicate, body_text, exact_date, img_url, prepare_log = page_future.result()
+        for line in prepare_log:
+            print(line)
+        if duplicate:
+            self.mark_posted(article['link'])
             return False
 
-        body_text, exact_date = self.fetch_full_content(article['link'])
         if not body_text:
             print("⚠️ 본문 스크래핑 실패 → 스킵")
             return False
@@ -740,11 +1237,15 @@ class NewsTranslator:
             article['date'] = exact_date
             print(f"🕒 원문 시각 복원 성공: {exact_date.strftime('%Y-%m-%d %H:%M:%S')}")
 
+        # 특성 이미지 다운로드·업로드는 Gemini 번역과 독립적이므로 번역 대기 중에 병렬 처리
+        image_future = self.executor.submit(self._prepare_featured_image, img_url)
+
         print("🔄 [1단계] Gemini 번역 (1회 JSON 통합)...")
         translated = self.gemini.translate_article(article['title'], body_text)
 
         if not translated or not translated.get('title') or not translated.get('content'):
             print("❌ 번역 실패 → 스킵")
+            self._discard_featured_image(image_future)
             return False
 
         title_ko   = translated['title']
@@ -772,13 +1273,9 @@ class NewsTranslator:
         # 코멘트 도입부만 남고 내용이 없는 패턴 제거 (BeautifulSoup으로 처리)
         from bs4 import BeautifulSoup as _BS
         _soup = _BS(content_ko, 'lxml')
-        _comment_patterns = re.compile(
-            r'.{0,30}(다음과 같이 말했다|이렇게 말했다|다음과 같이 밝혔다|아래와 같이 코멘트했다'
-            r'|다음과 같이 코멘트|이와 같이 말했다|다음과 같이 전했다)\s*[\.。]?\s*$'
-        )
         for tag in _soup.find_all(['p', 'div']):
             text = tag.get_text(strip=True)
-            if _comment_patterns.search(text) and len(text) < 80:
+            if COMMENT_LEAD_RE.search(text) and len(text) < 80:
                 tag.decompose()
         content_ko = str(_soup.body or _soup)
 
@@ -786,51 +1283,26 @@ class NewsTranslator:
         plain_length = len(self._strip_html(content_ko))
         if plain_length < 500:
             print(f"⚠️ 본문 너무 짧음 ({plain_length}자 < 500자) → 스킵")
+            self._discard_featured_image(image_future)
             return False
         print(f"   ✅ 본문 길이: {plain_length}자")
         slug = self.generate_seo_slug(title_ko, article['date'], title_ja=article.get('title', ''))
         print(f"🔗 Slug: {slug}")
 
-        print("🔍 특성 이미지(Featured Image) 처리 중...")
-        featured_id = 0
-        img_url = self.get_main_image_url(article['link'])
-        if img_url:
-            local_img = self.download_image(img_url)
-            if local_img:
-                media_info = self.upload_media(local_img)
-                if media_info:
-                    featured_id = media_info['id']
-                try:
-                    local_img.unlink()
-                except:
-                    pass
+        featured_id = self._collect_featured_image(image_future)
 
         # ── SEO 보강: 2~3문장 요약 + 내부링크 ──
         lede_summary = self.build_lede_summary(excerpt, tldr_html)
         internal_links_html = self.build_internal_links_html(title_ko, limit=3)
 
-        final_content = ""
-        if lede_summary:
-            final_content += (
-                f"<p style='font-size:15px;line-height:1.7;color:#222;margin:0 0 18px 0;'>"
-                f"{lede_summary}</p>\n"
-            )
-
-        if tldr_html:
-            final_content += (
-                '<div style="background:#f8f9fa;padding:20px;border-radius:8px;'
-                'border-left:5px solid #0056b3;margin-bottom:30px;">\n'
-                '<h3 style="margin-top:0;color:#0056b3;">💡 핵심 요약</h3>\n'
-                f'{tldr_html}\n</div>\n\n'
-            )
-
-        final_content += content_ko
-        final_content += "\n\n" + internal_links_html
-        final_content += (
-            "\n\n<hr style='margin:40px 0 20px 0;border:0;border-top:1px solid #e0e0e0;'>\n"
-            f"<p style='font-size:13px;color:#777;'><strong>원문:</strong> "
-            f"<a href='{article['link']}' target='_blank' rel='noopener'>{article['title']}</a></p>"
-        )
+        final_content = "".join((
+            LEDE_TMPL.format(lede=lede_summary) if lede_summary else "",
+            TLDR_TMPL.format(tldr=tldr_html) if tldr_html else "",
+            content_ko,
+            "\n\n",
+            internal_links_html,
+            SOURCE_FOOTER_TMPL.format(link=article['link'], title=article['title']),
+        ))
 
 
         label = "draft(임시저장)" if POST_STATUS == "draft" else "publish(즉시공개)"
@@ -839,9 +1311,9 @@ class NewsTranslator:
         if self.post_to_wordpress(title_ko, final_content, slug, featured_id,
                                    article['date'], excerpt=excerpt, status=POST_STATUS):
             if not FORCE_UPDATE:
-                self.posted_articles.append(article['link'])
-                self.save_posted_articles()
+                self.mark_posted(article['link'])
             return True
+        self._delete_media(featured_id)
         return False
 
     def run(self):
@@ -858,34 +1330,51 @@ class NewsTranslator:
             sys.exit(1)
 
         print("🔑 Gemini API 키 검증...")
-        test = self.gemini._call_api("テスト를 한국어로 번역:", max_tokens=30)
-        if not test:
+        if not self.gemini.check_api_key():
             print("❌ Gemini API 키 오류 → 종료")
             sys.exit(1)
-        print(f"   ✅ API 정상: '{test}'")
-
-        articles = self.get_articles_to_process()
-        if not articles:
-            print("✅ 처리할 기사 없음")
-            return
+        print(f"   ✅ API 정상: {GEMINI_MODEL}")
 
+        articles = []
         success = 0
+        page_futures = {}
+        # 기사 수집부터 try 안에서 실행 → 처리할 기사가 없어도 finally에서 executor·세션 정리
         try:
+            articles = self.get_articles_to_process()
+            if not articles:
+                print("✅ 처리할 기사 없음")
+                return
+
+            if not FORCE_UPDATE:
+                self._wp_source_index = self.load_wp_source_index()
+
             for i, article in enumerate(articles, 1):
                 if self.gemini.rate_limit_hit:
                     print(f"\n🛑 429 런 종료 → 남은 {len(articles)-i+1}건 다음 런 이월")
                     break
+                # 현재 기사를 번역하는 동안 다음 기사의 중복 체크·페이지 파싱·정리를 미리 해 둔다
+                for upcoming in articles[i - 1:i + PREFETCH_AHEAD]:
+                    if upcoming['link'] not in page_futures:
+                        page_futures[upcoming['link']] = self.executor.submit(
+                            self._prepare_article, upcoming['link'])
                 print(f"\n[{i}/{len(articles)}]")
-                if self.process_article(article):
+                # 기사 사이 고정 대기는 두지 않음: Gemini 호출 간격(7초)과 429 백오프는
+                # GeminiEngine._call_api가 마지막 호출 시각 기준으로 필요한 만큼만 기다린다
+                if self.process_article(article, page_futures.pop(article['link'])):
                     success += 1
-                if i < len(articles):
-                    time.sleep(10)
         finally:
-            print(f"\n{'='*60}")
-            print(f"🏁 완료: {success}/{len(articles)}건 게시")
-            print(f"{'='*60}\n")
-            if success > 0:
+            if articles:
+                print(f"\n{'='*60}")
+                print(f"🏁 완료: {success}/{len(articles)}건 게시")
+                print(f"{'='*60}\n")
+            # 이번 런에 새로 기록된 링크(게시·WP 중복 확인분)가 있을 때만 저장·커밋
+            if self._posted_delta:
+                self.save_posted_articles()
                 self.commit_posted_articles()
+            self.executor.shutdown(wait=False, cancel_futures=True)
+            self.session.close()
+            self.wp_session.close()
+            self.gemini.session.close()
 
 
 if __name__ == "__main__":